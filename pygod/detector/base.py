@@ -4,6 +4,7 @@
 # License: BSD 2 clause
 
 import time
+from copy import copy
 from inspect import signature
 from abc import ABC, abstractmethod
 
@@ -342,6 +343,7 @@ class DeepDetector(Detector, ABC):
         Whether to save the embedding. Default: ``False``.
     compile_model : bool, optional
         Whether to compile the model with ``torch_geometric.compile``.
+        Sampled mini-batches are compiled with dynamic shapes.
         Default: ``False``.
     **kwargs
         Other parameters for the backbone.
@@ -386,6 +388,8 @@ class DeepDetector(Detector, ABC):
                  gan=False,
                  save_emb=False,
                  compile_model=False,
+                 mixed_precision=False,
+                 num_workers=0,
                  **kwargs):
 
         super(DeepDetector, self).__init__(contamination=contamination,
@@ -425,6 +429,14 @@ class DeepDetector(Detector, ABC):
         if save_emb:
             self.emb = None
         self.compile_model = compile_model
+        self.mixed_precision = mixed_precision
+        self.num_workers = num_workers
+        # detectors copying their batches with _to_device opt in to
+        # sampling into pinned memory
+        self._pin_memory = False
+        self._copy_stream = None
+        self._x = None
+        self._edge_index = None
 
     def fit(self, data, label=None):
 
@@ -432,13 +444,11 @@ class DeepDetector(Detector, ABC):
         self.num_nodes, self.in_dim = data.x.shape
         if self.batch_size == 0:
             self.batch_size = data.x.shape[0]
-        loader = NeighborLoader(data,
-                                self.num_neigh,
-                                batch_size=self.batch_size)
+        loader = self._loader(data)
 
         self.model = self.init_model(**self.kwargs)
         if self.compile_model:
-            self.model = compile(self.model)
+            self.model = self._compile(self.model)
         if not self.gan:
             optimizer = torch.optim.Adam(self.model.parameters(),
                                          lr=self.lr,
@@ -462,18 +472,18 @@ class DeepDetector(Detector, ABC):
                 batch_size = sampled_data.batch_size
                 node_idx = sampled_data.n_id
 
-                loss, score = self.forward_model(sampled_data)
+                with self._autocast():
+                    loss, score = self.forward_model(sampled_data)
+                if self.save_emb:
+                    emb = self._batch_emb(batch_size)
+                # loss.item() synchronizes with the device, after which
+                # non-blocking score and embedding copies are ready
                 epoch_loss += loss.item() * batch_size
                 if self.save_emb:
-                    if type(self.emb) is tuple:
-                        self.emb[0][node_idx[:batch_size]] = \
-                            self.model.emb[0][:batch_size].cpu()
-                        self.emb[1][node_idx[:batch_size]] = \
-                            self.model.emb[1][:batch_size].cpu()
-                    else:
-                        self.emb[node_idx[:batch_size]] = \
-                            self.model.emb[:batch_size].cpu()
-                self.decision_score_[node_idx[:batch_size]] = score
+                    self._write_emb(node_idx[:batch_size], emb)
+                self._write_score(self.decision_score_,
+                                  node_idx[:batch_size],
+                                  score)
 
                 optimizer.zero_grad()
                 loss.backward()
@@ -490,43 +500,48 @@ class DeepDetector(Detector, ABC):
                    verbose=self.verbose,
                    train=True)
 
+        if self.save_emb:
+            self._emb_to_host()
+        self._release_cache()
         self._process_decision_score()
         return self
 
     def decision_function(self, data, label=None):
 
         self.process_graph(data)
-        loader = NeighborLoader(data,
-                                self.num_neigh,
-                                batch_size=self.batch_size)
+        loader = self._loader(data)
 
         self.model.eval()
         outlier_score = torch.zeros(data.x.shape[0])
         if self.save_emb:
             if type(self.hid_dim) is tuple:
-                self.emb = (torch.zeros(data.x.shape[0], self.hid_dim[0]),
-                            torch.zeros(data.x.shape[0], self.hid_dim[1]))
+                self.emb = (torch.empty(data.x.shape[0], self.hid_dim[0],
+                                        device=self.device),
+                            torch.empty(data.x.shape[0], self.hid_dim[1],
+                                        device=self.device))
             else:
-                self.emb = torch.zeros(data.x.shape[0], self.hid_dim)
+                self.emb = torch.empty(data.x.shape[0], self.hid_dim,
+                                       device=self.device)
         start_time = time.time()
         test_loss = 0
         for sampled_data in loader:
-            loss, score = self.forward_model(sampled_data)
+            with self._autocast():
+                loss, score = self.forward_model(sampled_data)
             batch_size = sampled_data.batch_size
             node_idx = sampled_data.n_id
             if self.save_emb:
-                if type(self.hid_dim) is tuple:
-                    self.emb[0][node_idx[:batch_size]] = \
-                        self.model.emb[0][:batch_size].cpu()
-                    self.emb[1][node_idx[:batch_size]] = \
-                        self.model.emb[1][:batch_size].cpu()
-                else:
-                    self.emb[node_idx[:batch_size]] = \
-                        self.model.emb[:batch_size].cpu()
-
+                emb = self._batch_emb(batch_size)
+            # loss.item() synchronizes with the device, after which
+            # non-blocking score and embedding copies are ready
             test_loss = loss.item() * batch_size
-            outlier_score[node_idx[:batch_size]] = score
+            if self.save_emb:
+                self._write_emb(node_idx[:batch_size], emb)
 
+            self._write_score(outlier_score, node_idx[:batch_size], score)
+
+        if self.save_emb:
+            self._emb_to_host()
+        self._release_cache()
         loss_value = test_loss / data.x.shape[0]
         if self.gan:
             loss_value = (self.epoch_loss_in / data.x.shape[0], loss_value)
@@ -623,6 +638,220 @@ class DeepDetector(Detector, ABC):
 
         return output
 
+    def _loader(self, data):
+        """
+        Build the neighbor sampling loader of the input graph. When a
+        single batch covers the whole graph, the sampling is skipped and
+        the graph is used directly as the only batch.
+
+        Parameters
+        ----------
+        data : torch_geometric.data.Data
+            The input graph.
+
+        Returns
+        -------
+        loader : iterable of torch_geometric.data.Data
+            The loader of the sampled mini-batches.
+        """
+        if self._is_full_batch(data.num_nodes):
+            batch = copy(data)
+            batch.n_id = torch.arange(data.num_nodes)
+            batch.batch_size = data.num_nodes
+            return [batch]
+
+        return NeighborLoader(data,
+                              self.num_neigh,
+                              batch_size=self.batch_size,
+                              num_workers=self.num_workers,
+                              persistent_workers=self.num_workers > 0,
+                              pin_memory=self._pin_memory)
+
+    def _is_full_batch(self, num_nodes):
+        """
+        Whether the input graph is processed in a single batch that
+        contains all of its nodes and edges.
+
+        Parameters
+        ----------
+        num_nodes : int
+            Number of nodes in the input graph.
+
+        Returns
+        -------
+        full_batch : bool
+            ``True`` if the batch covers the whole graph.
+        """
+        return (self.batch_size == 0 or
+                self.batch_size >= num_nodes) and \
+            all(n == -1 for n in self.num_neigh)
+
+    def _cache_full_batch(self, data):
+        """
+        Keep the input graph on the device when it is processed as a
+        full batch, which is the same in every epoch. ``forward_model``
+        uses ``_x`` and ``_edge_index`` instead of the batch when they
+        are not ``None``.
+
+        Parameters
+        ----------
+        data : torch_geometric.data.Data
+            The input graph.
+        """
+        self._x, self._edge_index = None, None
+        if self._is_full_batch(data.num_nodes):
+            self._x = data.x.to(self.device)
+            self._edge_index = data.edge_index.to(self.device)
+
+    def _release_cache(self):
+        """
+        Release the graph kept on the device by ``_cache_full_batch``
+        once the input graph is processed.
+        """
+        self._x, self._edge_index = None, None
+
+    def _autocast(self):
+        """
+        Autocast context for the forward pass, enabled on GPU when
+        ``mixed_precision`` is ``True``.
+
+        Returns
+        -------
+        context : torch.autocast
+            The autocast context manager.
+        """
+        device_type = torch.device(self.device).type
+        return torch.autocast(device_type,
+                              dtype=torch.bfloat16,
+                              enabled=self.mixed_precision and
+                              device_type == 'cuda')
+
+    def _to_device(self, *tensors):
+        """
+        Copy tensors to the device of the detector. On GPU, the copies
+        are non-blocking and issued on a dedicated stream, which the
+        current stream waits for before using the tensors.
+
+        Parameters
+        ----------
+        *tensors : torch.Tensor
+            The tensors to copy, ideally in pinned memory.
+
+        Returns
+        -------
+        tensors : tuple of torch.Tensor
+            The tensors on the device of the detector.
+        """
+        if not self._pin_memory:
+            return tuple(t.to(self.device) for t in tensors)
+
+        if self._copy_stream is None:
+            self._copy_stream = torch.cuda.Stream(self.device)
+        with torch.cuda.stream(self._copy_stream):
+            tensors = tuple(t.to(self.device, non_blocking=True)
+                            for t in tensors)
+        current_stream = torch.cuda.current_stream(self.device)
+        current_stream.wait_stream(self._copy_stream)
+        for t in tensors:
+            # the memory is allocated on the copy stream but used on the
+            # current stream, prevent reuse before the current stream
+            t.record_stream(current_stream)
+        return tensors
+
+    def _batch_emb(self, batch_size):
+        """
+        Get the embeddings of the target nodes of the current batch on
+        the device of ``emb``. Copies to the host are non-blocking and
+        ready after the next synchronization with the device.
+
+        Parameters
+        ----------
+        batch_size : int
+            Number of target nodes in the current batch.
+
+        Returns
+        -------
+        emb : tuple of torch.Tensor
+            The embeddings of the target nodes.
+        """
+        emb = self.model.emb
+        if type(emb) is not tuple:
+            emb = (emb,)
+        buffers = self.emb if type(self.emb) is tuple else (self.emb,)
+        return tuple(e[:batch_size].detach().to(b.device,
+                                                torch.float32,
+                                                non_blocking=True)
+                     for e, b in zip(emb, buffers))
+
+    def _write_emb(self, node_idx, emb):
+        """
+        Write the embeddings of a batch into ``emb``.
+
+        Parameters
+        ----------
+        node_idx : torch.Tensor
+            Indices of the target nodes in the input graph.
+        emb : tuple of torch.Tensor
+            The embeddings of the target nodes from ``_batch_emb``.
+        """
+        buffers = self.emb if type(self.emb) is tuple else (self.emb,)
+        for buffer, e in zip(buffers, emb):
+            buffer[node_idx] = e
+
+    def _write_score(self, score_buffer, node_idx, score):
+        """
+        Write the outlier scores of a batch, once the non-blocking
+        copies from ``forward_model`` are ready.
+
+        Parameters
+        ----------
+        score_buffer : torch.Tensor
+            The outlier scores of all nodes.
+        node_idx : torch.Tensor
+            Indices of the target nodes in the input graph.
+        score : torch.Tensor
+            The outlier scores of the target nodes from
+            ``forward_model``.
+        """
+        score_buffer[node_idx] = score
+
+    def _emb_to_host(self):
+        """
+        Move ``emb`` to the host once all batches are written.
+        """
+        if type(self.emb) is tuple:
+            self.emb = tuple(e.cpu() for e in self.emb)
+        else:
+            self.emb = self.emb.cpu()
+
+    def _compile(self, model):
+        """
+        Compile the neural network detector, used when
+        ``compile_model`` is ``True``. Sampled mini-batches of any
+        detector are compiled with dynamic shapes. A full batch kept on
+        a GPU by ``_cache_full_batch`` is replayed as a CUDA graph.
+
+        Parameters
+        ----------
+        model : torch.nn.Module
+            The initialized neural network detector.
+
+        Returns
+        -------
+        model : torch.nn.Module
+            The compiled neural network detector.
+        """
+        if self._edge_index is not None and \
+                torch.device(self.device).type == 'cuda':
+            # a full batch has static shapes, so the steady-state step
+            # is captured once and replayed as a CUDA graph
+            return compile(model, mode='reduce-overhead')
+        if not self._is_full_batch(self.num_nodes):
+            # sampled subgraphs change in size from batch to batch, which
+            # would otherwise recompile for every size
+            return compile(model, dynamic=True)
+        return compile(model)
+
     @abstractmethod
     def init_model(self, **kwargs):
         """
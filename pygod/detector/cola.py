@@ -60,8 +60,16 @@ class CoLA(DeepDetector):
     save_emb : bool, optional
         Whether to save the embedding. Default: ``False``.
     compile_model : bool, optional
-        Whether to compile the model with ``torch_geometric.compile``.
-        Default: ``False``.
+        Whether to compile the model with ``torch.compile``. Full
+        batch training is replayed with CUDA graphs, while sampled
+        mini-batches use dynamic shapes. Default: ``False``.
+    mixed_precision : bool, optional
+        Whether to run the forward pass in ``bfloat16`` autocast on
+        GPU. Default: ``False``.
+    num_workers : int, optional
+        Number of worker processes sampling mini-batches, kept alive
+        across epochs. ``0`` samples in the main process.
+        Default: ``0``.
     **kwargs
         Other parameters for the backbone.
 
@@ -104,6 +112,8 @@ class CoLA(DeepDetector):
                  verbose=0,
                  save_emb=False,
                  compile_model=False,
+                 mixed_precision=False,
+                 num_workers=0,
                  **kwargs):
         super(CoLA, self).__init__(hid_dim=hid_dim,
                                    num_layers=num_layers,
@@ -120,15 +130,25 @@ class CoLA(DeepDetector):
                                    verbose=verbose,
                                    save_emb=save_emb,
                                    compile_model=compile_model,
+                                   mixed_precision=mixed_precision,
+                                   num_workers=num_workers,
                                    **kwargs)
+        self._pin_memory = torch.device(self.device).type == 'cuda'
+        self._pos_label = None
+        self._neg_label = None
 
     def process_graph(self, data):
-        pass
+        self._cache_full_batch(data)
 
     def init_model(self, **kwargs):
         if self.save_emb:
-            self.emb = torch.zeros(self.num_nodes,
-                                   self.hid_dim)
+            self.emb = torch.empty(self.num_nodes,
+                                   self.hid_dim,
+                                   device=self.device)
+        # contrastive labels only depend on the batch size, so they are
+        # built once on the device and sliced for each batch
+        self._pos_label = torch.ones(self.batch_size, device=self.device)
+        self._neg_label = torch.zeros(self.batch_size, device=self.device)
         return CoLABase(in_dim=self.in_dim,
                         hid_dim=self.hid_dim,
                         num_layers=self.num_layers,
@@ -140,17 +160,23 @@ class CoLA(DeepDetector):
     def forward_model(self, data):
         batch_size = data.batch_size
 
-        x = data.x.to(self.device)
-        edge_index = data.edge_index.to(self.device)
+        if self._edge_index is None:
+            x, edge_index = self._to_device(data.x, data.edge_index)
+        else:
+            x, edge_index = self._x, self._edge_index
 
         pos_logits, neg_logits = self.model(x, edge_index)
-        logits = torch.cat([pos_logits[:batch_size],
-                            neg_logits[:batch_size]])
-        con_label = torch.cat([torch.ones(batch_size),
-                               torch.zeros(batch_size)]).to(self.device)
+        pos_logits = pos_logits[:batch_size]
+        neg_logits = neg_logits[:batch_size]
 
-        loss = self.model.loss_func(logits, con_label)
+        # same as the mean loss over the concatenated logits and labels
+        loss = (self.model.loss_func(pos_logits,
+                                     self._pos_label[:batch_size],
+                                     reduction='sum') +
+                self.model.loss_func(neg_logits,
+                                     self._neg_label[:batch_size],
+                                     reduction='sum')) / (2 * batch_size)
 
-        score = neg_logits[:batch_size] - pos_logits[:batch_size]
+        score = (neg_logits - pos_logits).float()
 
-        return loss, score.detach().cpu()
+        return loss, score.detach().to('cpu', non_blocking=True)
@@ -4,6 +4,7 @@
 # License: BSD 2 clause
 
 import torch
+import weakref
 import warnings
 
 from . import DeepDetector
@@ -76,8 +77,16 @@ class DONE(DeepDetector):
     save_emb : bool, optional
         Whether to save the embedding. Default: ``False``.
     compile_model : bool, optional
-        Whether to compile the model with ``torch_geometric.compile``.
-        Default: ``False``.
+        Whether to compile the model with ``torch.compile``. Full
+        batch training is replayed with CUDA graphs, while sampled
+        mini-batches use dynamic shapes. Default: ``False``.
+    mixed_precision : bool, optional
+        Whether to run the forward pass in ``bfloat16`` autocast on
+        GPU. Default: ``False``.
+    num_workers : int, optional
+        Number of worker processes sampling mini-batches, kept alive
+        across epochs. ``0`` samples in the main process.
+        Default: ``0``.
     **kwargs
         Other parameters for the backbone model.
 
@@ -131,6 +140,8 @@ class DONE(DeepDetector):
                  verbose=0,
                  save_emb=False,
                  compile_model=False,
+                 mixed_precision=False,
+                 num_workers=0,
                  **kwargs):
 
         if backbone is not None:
@@ -150,7 +161,10 @@ class DONE(DeepDetector):
                                    verbose=verbose,
                                    save_emb=save_emb,
                                    compile_model=compile_model,
+                                   mixed_precision=mixed_precision,
+                                   num_workers=num_workers,
                                    **kwargs)
+        self._pin_memory = torch.device(self.device).type == 'cuda'
 
         self.w1 = w1
         self.w2 = w2
@@ -162,18 +176,49 @@ class DONE(DeepDetector):
         self.attribute_score_ = None
         self.structural_score_ = None
         self.combined_score_ = None
+        self._scores = None
+        self._s = None
+        self._s_dense = None
+        self._s_edge_index = None
+        self._s_key = None
 
     def process_graph(self, data):
-        DONEBase.process_graph(data)
+        # the sparse structure matrix is kept on the device and only
+        # rebuilt when the graph changes, including in-place edits of
+        # the edge index, which bump its version
+        s_key = (data.edge_index._version,
+                 data.edge_index.shape,
+                 data.num_nodes)
+        if self._s_edge_index is None or \
+                self._s_edge_index() is not data.edge_index or \
+                self._s_key != s_key:
+            s = torch.sparse_coo_tensor(data.edge_index,
+                                        torch.ones(data.num_edges),
+                                        (data.num_nodes, data.num_nodes))
+            self._s = s.coalesce().to(self.device)
+            self._s_edge_index = weakref.ref(data.edge_index)
+            self._s_key = s_key
+        self._cache_full_batch(data)
+        if self._edge_index is not None:
+            # a full batch uses the whole matrix in every step
+            self._s_dense = self._s.to_dense()
+
+    def _release_cache(self):
+        super(DONE, self)._release_cache()
+        self._s_dense = None
 
     def init_model(self, **kwargs):
-        self.attribute_score_ = torch.zeros(self.num_nodes)
-        self.structural_score_ = torch.zeros(self.num_nodes)
-        self.combined_score_ = torch.zeros(self.num_nodes)
+        # the three scores share one buffer to be gathered in one copy
+        self._scores = torch.zeros(3, self.num_nodes)
+        self.attribute_score_ = self._scores[0]
+        self.structural_score_ = self._scores[1]
+        self.combined_score_ = self._scores[2]
 
         if self.save_emb:
-            self.emb = (torch.zeros(self.num_nodes, self.hid_dim),
-                        torch.zeros(self.num_nodes, self.hid_dim))
+            self.emb = (torch.empty(self.num_nodes, self.hid_dim,
+                                    device=self.device),
+                        torch.empty(self.num_nodes, self.hid_dim,
+                                    device=self.device))
 
         return DONEBase(x_dim=self.in_dim,
                         s_dim=self.num_nodes,
@@ -188,29 +233,45 @@ class DONE(DeepDetector):
                         w5=self.w5,
                         **kwargs).to(self.device)
 
+    def _compile(self, model):
+        # the loss is a fixed sequence of elementwise ops and reductions
+        # on the target nodes, compiled on its own for kernel fusion
+        model.loss_func = torch.compile(model.loss_func, dynamic=True)
+        return super(DONE, self)._compile(model)
+
     def forward_model(self, data):
         batch_size = data.batch_size
         node_idx = data.n_id
 
-        x = data.x.to(self.device)
-        s = data.s.to(self.device)
-        edge_index = data.edge_index.to(self.device)
+        if self._edge_index is None:
+            x, edge_index, n_id = self._to_device(data.x,
+                                                  data.edge_index,
+                                                  node_idx)
+            s = self._s.index_select(0, n_id).to_dense()
+        else:
+            x, edge_index, s = self._x, self._edge_index, self._s_dense
 
-        x_, s_, h_a, h_s, dna, dns = self.model(x, s, edge_index)
+        x_, s_, h_a, h_s, dna, dns = self.model(x, s, edge_index,
+                                                batch_size)
         loss, oa, os, oc = self.model.loss_func(x[:batch_size],
-                                                x_[:batch_size],
+                                                x_,
                                                 s[:batch_size],
-                                                s_[:batch_size],
-                                                h_a[:batch_size],
-                                                h_s[:batch_size],
-                                                dna[:batch_size],
-                                                dns[:batch_size])
+                                                s_,
+                                                h_a,
+                                                h_s,
+                                                dna,
+                                                dns)
+
+        # one non-blocking copy of the three scores, which is ready
+        # after the synchronization with the device in the training loop
+        scores = torch.stack([oa, os, oc]).detach().float()
+        scores = scores.to('cpu', non_blocking=True)
 
-        self.attribute_score_[node_idx[:batch_size]] = oa.detach().cpu()
-        self.structural_score_[node_idx[:batch_size]] = os.detach().cpu()
-        self.combined_score_[node_idx[:batch_size]] = oc.detach().cpu()
+        return loss, scores
 
-        return loss, ((oa + os + oc) / 3).detach().cpu()
+    def _write_score(self, score_buffer, node_idx, score):
+        self._scores.index_copy_(1, node_idx, score)
+        score_buffer[node_idx] = score.mean(0)
 
     def decision_function(self, data, label=None):
         if data is not None:
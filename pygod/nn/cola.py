@@ -80,6 +80,6 @@ class CoLABase(nn.Module):
         self.emb = self.encoder(x, edge_index)
         logits = self.discriminator(x, self.emb)
 
-        perm_idx = torch.randperm(x.shape[0]).to(x.device)
+        perm_idx = torch.randperm(x.shape[0], device=x.device)
         neg_logits = self.discriminator(x[perm_idx], self.emb)
         return logits.squeeze(), neg_logits.squeeze()
@@ -115,7 +115,7 @@ class DONEBase(nn.Module):
         self.neigh_diff = NeighDiff()
         self.emb = None
 
-    def forward(self, x, s, edge_index):
+    def forward(self, x, s, edge_index, batch_size=None):
         """
         Forward computation.
 
@@ -127,6 +127,10 @@ class DONEBase(nn.Module):
             Input structure embeddings.
         edge_index : torch.Tensor
             Edge index.
+        batch_size : int, optional
+            Number of target nodes at the beginning of the input. If
+            not ``None``, only the outputs of the target nodes are
+            returned. Default: ``None``.
 
         Returns
         -------
@@ -151,7 +155,10 @@ class DONEBase(nn.Module):
         dns = self.neigh_diff(h_s, edge_index).squeeze()
         self.emb = (h_a, h_s)
 
-        return x_, s_, h_a, h_s, dna, dns
+        # the decoders see the whole subgraph, as their normalization
+        # depends on the batch, and only the target nodes are returned
+        return x_[:batch_size], s_[:batch_size], h_a[:batch_size], \
+            h_s[:batch_size], dna[:batch_size], dns[:batch_size]
 
     def loss_func(self, x, x_, s, s_, h_a, h_s, dna, dns):
         """
@@ -1,5 +1,12 @@
 # -*- coding: utf-8 -*-
+import os
 import unittest
+from numpy.testing import assert_equal
+
+import torch
+from torch_geometric.loader import NeighborLoader
+from torch_geometric.seed import seed_everything
+
 from pygod.detector import DOMINANT
 
 
@@ -19,3 +26,22 @@ class TestBase(unittest.TestCase):
         with self.assertRaises(ValueError):
             DOMINANT(num_neigh='1, 2, 3')
 
+    def test_full_batch_loader(self):
+        data = torch.load(os.path.join('pygod/test/train_graph.pt'))
+        detector = DOMINANT(epoch=1, batch_size=data.num_nodes)
+        detector.fit(data)
+
+        batch, = detector._loader(data)
+        sampled_batch, = NeighborLoader(data,
+                                        detector.num_neigh,
+                                        batch_size=data.num_nodes)
+        assert_equal(batch.n_id.numpy(), sampled_batch.n_id.numpy())
+        assert_equal(batch.batch_size, sampled_batch.batch_size)
+
+        detector.model.eval()
+        with torch.no_grad():
+            seed_everything(717)
+            _, score = detector.forward_model(batch)
+            seed_everything(717)
+            _, sampled_score = detector.forward_model(sampled_batch)
+        assert (torch.allclose(score, sampled_score, atol=1e-6))
@@ -114,3 +114,54 @@ class TestCoLA(unittest.TestCase):
             detector.predict(self.test_data,
                              return_prob=True,
                              prob_method='something')
+
+    def test_refit(self):
+        # the embeddings of a previous fit are not overwritten by a
+        # refit on a graph of the same size
+        detector = CoLA(epoch=2, save_emb=True)
+        detector.fit(self.train_data)
+        emb = detector.emb
+        expected_emb = emb.clone()
+        detector.fit(self.train_data)
+        assert (torch.equal(emb, expected_emb))
+
+    def test_compile(self):
+        # full batch and sampled mini-batches
+        for batch_size, num_neigh in [(0, -1), (16, 3)]:
+            detector = CoLA(epoch=1,
+                            batch_size=batch_size,
+                            num_neigh=num_neigh,
+                            save_emb=True,
+                            compile_model=True)
+            detector.fit(self.train_data)
+            assert_equal(detector.decision_score_.shape[0],
+                         self.train_data.num_nodes)
+            assert (torch.isfinite(detector.decision_score_).all())
+
+    def test_num_workers(self):
+        detector = CoLA(epoch=2, batch_size=16, num_neigh=3, num_workers=1)
+        loader = detector._loader(self.train_data)
+        assert (loader.persistent_workers)
+
+        detector.fit(self.train_data)
+        assert_equal(detector.decision_score_.shape[0],
+                     self.train_data.num_nodes)
+        assert (torch.isfinite(detector.decision_score_).all())
+
+    @unittest.skipUnless(torch.cuda.is_available(), "CUDA is required")
+    def test_mixed_precision(self):
+        detector = CoLA(epoch=2,
+                        gpu=0,
+                        batch_size=16,
+                        num_neigh=3,
+                        save_emb=True,
+                        mixed_precision=True)
+        detector.fit(self.train_data)
+        assert (torch.isfinite(detector.decision_score_).all())
+        assert (detector.emb.dtype == torch.float32)
+
+        batch = next(iter(detector._loader(self.train_data)))
+        with detector._autocast():
+            loss, score = detector.forward_model(batch)
+        assert (torch.isfinite(loss))
+        assert (score.dtype == torch.float32)
@@ -7,10 +7,12 @@ from numpy.testing import assert_raises
 
 import torch
 from torch_geometric.nn import GIN
+from torch_geometric.loader import NeighborLoader
 from torch_geometric.seed import seed_everything
 
 from pygod.metric import eval_roc_auc
 from pygod.detector import DONE
+from pygod.nn import DONEBase
 
 seed_everything(717)
 
@@ -125,6 +127,96 @@ class TestDONE(unittest.TestCase):
             detector.predict(return_prob=True,
                              prob_method='something')
 
+    def test_compile(self):
+        # full batch and sampled mini-batches
+        for batch_size, num_neigh in [(0, -1), (16, 3)]:
+            detector = DONE(epoch=1,
+                            batch_size=batch_size,
+                            num_neigh=num_neigh,
+                            save_emb=True,
+                            compile_model=True)
+            detector.fit(self.train_data)
+            assert_equal(detector.decision_score_.shape[0],
+                         self.train_data.num_nodes)
+            assert (torch.isfinite(detector.decision_score_).all())
+
+    @unittest.skipUnless(torch.cuda.is_available(), "CUDA is required")
+    def test_mixed_precision(self):
+        detector = DONE(epoch=2,
+                        gpu=0,
+                        batch_size=16,
+                        num_neigh=3,
+                        save_emb=True,
+                        mixed_precision=True)
+        detector.fit(self.train_data)
+        assert (torch.isfinite(detector.decision_score_).all())
+
+        for e in detector.emb:
+            assert (e.dtype == torch.float32)
+
+        batch = next(iter(detector._loader(self.train_data)))
+        with detector._autocast():
+            loss, score = detector.forward_model(batch)
+        assert (torch.isfinite(loss))
+        assert (score.dtype == torch.float32)
+
+    def test_single_target_batch(self):
+        # the last batch has a single target node, which the decoders
+        # with batch normalization must handle
+        batch_size = 23
+        assert_equal(self.train_data.num_nodes % batch_size, 1)
+        detector = DONE(num_layers=4, epoch=2, batch_size=batch_size)
+        detector.fit(self.train_data)
+        assert_equal(detector.decision_score_.shape[0],
+                     self.train_data.num_nodes)
+
+    def test_refit(self):
+        # results from a previous fit are not overwritten by a refit
+        # on a graph of the same size
+        detector = DONE(epoch=2, save_emb=True)
+        detector.fit(self.train_data)
+        attribute_score = detector.attribute_score_
+        emb = detector.emb[0]
+        expected_score = attribute_score.clone()
+        expected_emb = emb.clone()
+        detector.fit(self.train_data)
+        assert (torch.equal(attribute_score, expected_score))
+        assert (torch.equal(emb, expected_emb))
+
+    def test_structure(self):
+        DONEBase.process_graph(self.train_data)
+
+        detector = DONE(epoch=1)
+        detector.process_graph(self.train_data)
+        assert (torch.equal(detector._s_dense, self.train_data.s))
+
+        # the full batch is released from the device after fitting
+        detector.fit(self.train_data)
+        assert (detector._x is None)
+        assert (detector._edge_index is None)
+        assert (detector._s_dense is None)
+
+        detector = DONE(batch_size=16, num_neigh=3)
+        detector.process_graph(self.train_data)
+        loader = NeighborLoader(self.train_data,
+                                detector.num_neigh,
+                                batch_size=16)
+        for batch in loader:
+            s = detector._s.index_select(0, batch.n_id).to_dense()
+            assert (torch.equal(s, batch.s))
+
+    def test_structure_cache(self):
+        detector = DONE(batch_size=16, num_neigh=3)
+        detector.process_graph(self.train_data)
+        s = detector._s
+        detector.process_graph(self.train_data)
+        assert (detector._s is s)
+
+        edge_index = self.train_data.edge_index
+        edge_index[[0, 1]] = edge_index[[1, 0]]
+        detector.process_graph(self.train_data)
+        assert (detector._s is not s)
+
     def test_params(self):
         with assert_warns(UserWarning):
             DONE(backbone=GIN)